@@ -62,6 +62,7 @@ modules = [
     'scripts/geometry/NACA_volume_compute.py',
     'scripts/geometry/wing_fuel_volume_compute.py',
     'scripts/geometry/fuselage_planform_compute.py',
+    'scripts/geometry/wing_segmented_planform_compute.py',
     'scripts/industrial_costs/industrial_costs.py',
     'scripts/internal_combustion_propeller/ICE_Test.py',
     'scripts/internal_combustion_propeller/ICE_CS_Test.py',
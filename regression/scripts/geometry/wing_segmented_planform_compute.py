@@ -0,0 +1,217 @@
+# wing_segmented_planform_compute.py
+#
+# Created:  Oct 2026
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+
+from SUAVE.Methods.Geometry.Two_Dimensional.Planform import wing_segmented_planform
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    # ------------------------------------------------------------------
+    # Testing
+    # Cranked main wing with a chord step
+    # ------------------------------------------------------------------
+
+    # Setup
+    wing = main_wing_setup()
+
+    # Compute
+    wing_segmented_planform(wing, overwrite_reference = True)
+
+    # Truth Values
+    truth = Data()
+    truth.reference_area     = 123.30744052598402
+    truth.wetted_area        = 125.7735893365037
+    truth.aspect_ratio       = 9.552241089229277
+    truth.total_span         = 34.43789723009333
+    truth.mean_aerodynamic   = 4.433502988283453
+    truth.mean_geometric     = 3.5928741412000007
+    truth.tip_chord          = 0.7819752
+    truth.taper              = 0.10077
+    truth.quarter_chord      = 0.48604163970081565
+    truth.leading_edge       = 0.5581122114264023
+    truth.thickness_to_chord = 0.1
+    truth.total_length       = 11.495354915096705
+    truth.aerodynamic_center = np.array([6.234159749449, 0.            , 0.401993508067])
+    truth.single_side_ac     = np.array([5.125784002378, 6.327622605061, 0.401993508067])
+
+    check_results(wing,truth)
+
+    # ------------------------------------------------------------------
+    # Testing
+    # Asymmetric tail with an untapered segment
+    # ------------------------------------------------------------------
+
+    # Setup
+    wing = vertical_tail_setup()
+
+    # Compute
+    wing_segmented_planform(wing, overwrite_reference = True)
+
+    # Truth Values
+    truth = Data()
+    truth.reference_area     = 34.03125
+    truth.wetted_area        = 69.60487499999999
+    truth.aspect_ratio       = 1.6528925619834711
+    truth.total_span         = 7.5
+    truth.mean_aerodynamic   = 4.904132231404958
+    truth.mean_geometric     = 4.5375
+    truth.tip_chord          = 2.0999999999999996
+    truth.taper              = 0.35
+    truth.quarter_chord      = 0.6337867040046035
+    truth.leading_edge       = 0.7130984156853598
+    truth.thickness_to_chord = 0.11330578512396694
+    truth.total_length       = 8.586979210887016
+    truth.aerodynamic_center = np.array([5.146026316833, 3.145661157025, 0.            ])
+    truth.single_side_ac     = np.array([3.919993258982, 3.145661157025, 0.            ])
+
+    check_results(wing,truth)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Check Results
+# ----------------------------------------------------------------------
+def check_results(wing,truth):
+
+    results = Data()
+    results.reference_area     = wing.areas.reference
+    results.wetted_area        = wing.areas.wetted
+    results.aspect_ratio       = wing.aspect_ratio
+    results.total_span         = wing.spans.total
+    results.mean_aerodynamic   = wing.chords.mean_aerodynamic
+    results.mean_geometric     = wing.chords.mean_geometric
+    results.tip_chord          = wing.chords.tip
+    results.taper              = wing.taper
+    results.quarter_chord      = wing.sweeps.quarter_chord
+    results.leading_edge       = wing.sweeps.leading_edge
+    results.thickness_to_chord = wing.thickness_to_chord
+    results.total_length       = wing.total_length
+    results.aerodynamic_center = wing.aerodynamic_center
+    results.single_side_ac     = wing.single_side_aerodynamic_center
+
+    # Compute Errors
+    for k,v in list(truth.items()):
+        error = np.max(np.abs(results[k]-v)/np.maximum(np.abs(v),1.))
+        print(k, results[k], error)
+        assert error<1e-6, 'Check Failed : %s' % k
+
+    return
+
+# ----------------------------------------------------------------------
+#   Wings
+# ----------------------------------------------------------------------
+def main_wing_setup():
+
+    wing = SUAVE.Components.Wings.Main_Wing()
+    wing.tag            = 'main_wing'
+    wing.spans.projected = 34.32
+    wing.chords.root     = 7.760
+    wing.symmetric       = True
+
+    segment = SUAVE.Components.Wings.Segment()
+    segment.tag                   = 'Root'
+    segment.percent_span_location = 0.0
+    segment.twist                 = 4. * Units.deg
+    segment.root_chord_percent    = 1.
+    segment.thickness_to_chord    = 0.1
+    segment.dihedral_outboard     = 2.5 * Units.degrees
+    segment.sweeps.quarter_chord  = 28.225 * Units.degrees
+    wing.append_segment(segment)
+
+    segment = SUAVE.Components.Wings.Segment()
+    segment.tag                   = 'Yehudi'
+    segment.percent_span_location = 0.324
+    segment.twist                 = 0.047193 * Units.deg
+    segment.root_chord_percent    = 0.5
+    segment.thickness_to_chord    = 0.1
+    segment.dihedral_outboard     = 5.5 * Units.degrees
+    segment.sweeps.quarter_chord  = 25. * Units.degrees
+    wing.append_segment(segment)
+
+    # A chord step, modelled as a second segment at the same span location
+    segment = SUAVE.Components.Wings.Segment()
+    segment.tag                   = 'Step'
+    segment.percent_span_location = 0.324
+    segment.twist                 = 0.047193 * Units.deg
+    segment.root_chord_percent    = 0.45
+    segment.thickness_to_chord    = 0.1
+    segment.dihedral_outboard     = 5.5 * Units.degrees
+    segment.sweeps.quarter_chord  = 25. * Units.degrees
+    wing.append_segment(segment)
+
+    segment = SUAVE.Components.Wings.Segment()
+    segment.tag                   = 'Section_2'
+    segment.percent_span_location = 0.963
+    segment.twist                 = 0.00258 * Units.deg
+    segment.root_chord_percent    = 0.220
+    segment.thickness_to_chord    = 0.1
+    segment.dihedral_outboard     = 5.5 * Units.degrees
+    segment.sweeps.quarter_chord  = 56.75 * Units.degrees
+    wing.append_segment(segment)
+
+    segment = SUAVE.Components.Wings.Segment()
+    segment.tag                   = 'Tip'
+    segment.percent_span_location = 1.
+    segment.twist                 = 0. * Units.degrees
+    segment.root_chord_percent    = 0.10077
+    segment.thickness_to_chord    = 0.1
+    segment.dihedral_outboard     = 0.
+    segment.sweeps.quarter_chord  = 0.
+    wing.append_segment(segment)
+
+    return wing
+
+def vertical_tail_setup():
+
+    wing = SUAVE.Components.Wings.Vertical_Tail()
+    wing.tag            = 'vertical_stabilizer'
+    wing.spans.projected = 7.5
+    wing.chords.root     = 6.0
+    wing.symmetric       = False
+
+    segment = SUAVE.Components.Wings.Segment()
+    segment.tag                   = 'Root'
+    segment.percent_span_location = 0.0
+    segment.root_chord_percent    = 1.
+    segment.thickness_to_chord    = 0.12
+    segment.dihedral_outboard     = 0.
+    segment.sweeps.quarter_chord  = 40. * Units.degrees
+    wing.append_segment(segment)
+
+    # The chord does not change over this segment
+    segment = SUAVE.Components.Wings.Segment()
+    segment.tag                   = 'Dorsal'
+    segment.percent_span_location = 0.25
+    segment.root_chord_percent    = 1.
+    segment.thickness_to_chord    = 0.11
+    segment.dihedral_outboard     = 0.
+    segment.sweeps.quarter_chord  = 35. * Units.degrees
+    wing.append_segment(segment)
+
+    segment = SUAVE.Components.Wings.Segment()
+    segment.tag                   = 'Tip'
+    segment.percent_span_location = 1.
+    segment.root_chord_percent    = 0.35
+    segment.thickness_to_chord    = 0.09
+    segment.dihedral_outboard     = 0.
+    segment.sweeps.quarter_chord  = 0.
+    wing.append_segment(segment)
+
+    return wing
+
+if __name__ == '__main__':
+
+    main()
+
+    print('Wing segmented planform regression test passed!')
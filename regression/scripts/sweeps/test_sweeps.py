@@ -8,6 +8,7 @@
 #   Imports
 # ----------------------------------------------------------------------
 
+import os
 import numpy as np
 from SUAVE.Optimization import carpet_plot, line_plot
 from SUAVE.Core import Units
@@ -44,6 +45,15 @@ def main():
     max_err_carp    = np.max(np.abs(outputs_carpet['objective']-truth_obj_carp)/truth_obj_carp) 
     print(' max_err_carp = ',  max_err_carp)
     assert(max_err_carp<1e-6)
+    
+    # Rerun the carpet plot over a pool of worker processes, it must match the serial sweep
+    # This needs more than one core, otherwise the workers would only take turns
+    number_of_processes = min(4, os.cpu_count() or 1)
+    if number_of_processes > 1:
+        outputs_parallel = variable_sweep(problem, number_of_processes)
+        max_err_parallel = np.max(np.abs(outputs_parallel['objective']-outputs_carpet['objective'])/outputs_carpet['objective'])
+        print(' max_err_parallel = ',  max_err_parallel)
+        assert(max_err_parallel<1e-6)
     return
         
 
@@ -52,10 +62,10 @@ def linear_sweep(problem):
     outputs = line_plot(problem, number_of_points, plot_obj = 0, plot_const = 0)
     return outputs
     
-def variable_sweep(problem):    
+def variable_sweep(problem, number_of_processes = 1):    
     number_of_points=2
     #run carpet plot, suppressing default plots
-    outputs=carpet_plot(problem, number_of_points,  plot_obj = 0, plot_const = 0)  
+    outputs=carpet_plot(problem, number_of_points,  plot_obj = 0, plot_const = 0, number_of_processes = number_of_processes)  
     return outputs
 
 if __name__ == '__main__':
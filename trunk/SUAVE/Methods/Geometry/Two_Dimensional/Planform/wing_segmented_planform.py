@@ -12,6 +12,15 @@ from SUAVE.Core import Data
 
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    # This allows SUAVE to run without numba, the kernels are then plain python
+    def njit(*args,**kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
 # ----------------------------------------------------------------------
 #  Methods
 # ----------------------------------------------------------------------
@@ -60,101 +69,36 @@ def wing_segmented_planform(wing, overwrite_reference = False):
     RC   = wing.chords.root
     sym  = wing.symmetric
     
-    # Pull all the segment data into array format
-    span_locs = []
-    twists    = []
-    sweeps    = []
-    dihedrals = []
-    chords    = []
-    t_cs      = []
-    for key in wing.Segments.keys():
-        seg = wing.Segments[key]
-        span_locs.append(seg.percent_span_location)
-        twists.append(seg.twist)
-        chords.append(seg.root_chord_percent)
-        sweeps.append(seg.sweeps.quarter_chord)
-        t_cs.append(seg.thickness_to_chord)
-        dihedrals.append(seg.dihedral_outboard)
-        
-    # Convert to arrays
-    chords    = np.array(chords)
-    span_locs = np.array(span_locs)
-    sweeps    = np.array(sweeps)
-    t_cs      = np.array(t_cs)
+    semispan = span/(1+sym)
     
-    # Basic calcs:
-    semispan     = span/(1+sym)
-    lengths_ndim = span_locs[1:]-span_locs[:-1]
-    lengths_dim  = lengths_ndim*semispan
-    chords_dim   = RC*chords
-    tapers       = chords[1:]/chords[:-1]
+    # Pull all the segment data into a single table, one contiguous row per property
+    segment_table = np.empty((6,len(wing.Segments)))
+    for i, seg in enumerate(wing.Segments.values()):
+        segment_table[:,i] = (seg.percent_span_location, seg.twist, seg.root_chord_percent,
+                              seg.sweeps.quarter_chord, seg.thickness_to_chord, seg.dihedral_outboard)
+    span_locs, twists, chords, sweeps, t_cs, dihedrals = segment_table
     
-    # Calculate the areas of each segment
-    As = (lengths_dim*chords_dim[:-1]-(chords_dim[:-1]-chords_dim[1:])*(lengths_dim/2))
-    
-    # Calculate the weighted area, this should not include any unexposed area 
-    A_wets = 2*(1+0.2*t_cs[:-1])*As
-    wet_area = np.sum(A_wets)
-    
-    # Calculate the wing area
-    ref_area = np.sum(As)*(1+sym)
-    
-    # Calculate the Aspect Ratio
-    AR = (span**2)/ref_area
-    
-    # Calculate the total span
-    lens = lengths_dim/np.cos(dihedrals[:-1])
-    total_len = np.sum(np.array(lens))*(1+sym)
-    
-    # Calculate the mean geometric chord
-    mgc = ref_area/span
-    
-    # Calculate the mean aerodynamic chord
-    A = chords_dim[:-1]
-    B = (A-chords_dim[1:])/(-lengths_ndim)
-    C = span_locs[:-1]
-    integral = ((A+B*(span_locs[1:]-C))**3-(A+B*(span_locs[:-1]-C))**3)/(3*B)
-    # For the cases when the wing doesn't taper in a spot
-    integral[np.isnan(integral)] = (A[np.isnan(integral)]**2)*((lengths_ndim)[np.isnan(integral)])
-    MAC = (semispan*(1+sym)/(ref_area))*np.sum(integral)
+    # Compute the planform properties from the segment arrays
+    ref_area, wet_area, AR, total_len, mgc, MAC, t_c, c_4_sweep, centroid, tan_le_sweep_total = \
+        _planform_core(float(span), float(RC), bool(sym), span_locs, chords, sweeps, t_cs, dihedrals)
     
     # Calculate the taper ratio
     lamda = chords[-1]/chords[0]
     
     # the tip chord
-    ct = chords_dim[-1]
-    
-    # Calculate an average t/c weighted by area
-    t_c = np.sum(As*t_cs[:-1])/(ref_area/2)
-    
-    # Calculate the segment leading edge sweeps
-    r_offsets = chords_dim[:-1]/4
-    t_offsets = chords_dim[1:]/4
-    le_sweeps = np.arctan((r_offsets+np.tan(sweeps[:-1])*(lengths_dim)-t_offsets)/(lengths_dim))    
-    
-    # Calculate the effective sweeps
-    c_4_sweep   = np.arctan(np.sum(lengths_ndim*np.tan(sweeps[:-1])))
-    le_sweep_total= np.arctan(np.sum(lengths_ndim*np.tan(le_sweeps)))
-
-    # Calculate the aerodynamic center, but first the centroid
-    dxs = np.cumsum(np.concatenate([np.array([0]),np.tan(le_sweeps[:-1])*lengths_dim[:-1]]))
-    dys = np.cumsum(np.concatenate([np.array([0]),lengths_dim[:-1]]))
-    dzs = np.cumsum(np.concatenate([np.array([0]),np.tan(dihedrals[:-2])*lengths_dim[:-1]]))
-    
-    Cxys = []
-    for i in range(len(lengths_dim)):
-        Cxys.append(segment_centroid(le_sweeps[i],lengths_dim[i],dxs[i],dys[i],dzs[i], tapers[i], 
-                                     As[i], dihedrals[i], chords_dim[i], chords_dim[i+1]))
+    ct = chords[-1]*RC
 
-    aerodynamic_center= (np.dot(np.transpose(Cxys),As)/(ref_area/(1+sym)))
-
-    single_side_aerodynamic_center = (np.array(aerodynamic_center)*1.)
-    single_side_aerodynamic_center[0] = single_side_aerodynamic_center[0] - MAC*.25    
+    # Calculate the aerodynamic center
+    aerodynamic_center             = centroid
+    single_side_aerodynamic_center = centroid - np.array([MAC*.25,0.,0.])
     if sym== True:
         aerodynamic_center[1] = 0
     
     # Total length for supersonics
-    total_length = np.tan(le_sweep_total)*semispan + chords[-1]*RC
+    total_length = tan_le_sweep_total*semispan + ct
+    
+    # The effective leading edge sweep
+    le_sweep_total = np.arctan(tan_le_sweep_total)
     
     # Pack stuff
     if overwrite_reference:
@@ -176,9 +120,11 @@ def wing_segmented_planform(wing, overwrite_reference = False):
     
     return wing
 
-# Segment centroid
-def segment_centroid(le_sweep,seg_span,dx,dy,dz,taper,A,dihedral,root_chord,tip_chord):
-    """Computes the centroid of a trapezoidal segment
+# Segment moments
+@njit(inline='always', cache=True)
+def segment_moments(tan_le_sweep,seg_span,dx,dy,dz,A,tan_dihedral,root_chord,tip_chord):
+    """Computes the first moments of area of a trapezoidal segment, ie its 
+    centroid multiplied by its area
     
     Assumptions:
     Polygon
@@ -187,18 +133,18 @@ def segment_centroid(le_sweep,seg_span,dx,dy,dz,taper,A,dihedral,root_chord,tip_
     None
     
     Inputs:
-    le_sweep      [rad]
+    tan_le_sweep  [-]
     seg_span      [m]
     dx            [m]
     dy            [m]
-    taper         [dimensionless]
+    dz            [m]
     A             [m**2]
-    dihedral      [radians]
+    tan_dihedral  [-]
     root_chord    [m]
     tip_chord     [m]
 
     Outputs:
-    cx,cy         [m,m]
+    mx,my,mz      [m**3,m**3,m**3]
 
     Properties Used:
     N/A
@@ -206,9 +152,144 @@ def segment_centroid(le_sweep,seg_span,dx,dy,dz,taper,A,dihedral,root_chord,tip_
     
     a = tip_chord
     b = root_chord
-    c = np.tan(le_sweep)*seg_span
-    cx = (2*a*c + a**2 + c*b + a*b + b**2) / (3*(a+b))
-    cy = seg_span / 3. * (( 1. + 2. * taper ) / (1. + taper))
-    cz = cy * np.tan(dihedral)    
+    c = tan_le_sweep*seg_span
+    mx = seg_span * (2*a*c + a*a + c*b + a*b + b*b) / 6.
+    my = seg_span * seg_span * (b + 2.*a) / 6.
+    mz = my * tan_dihedral
+    
+    return mx+dx*A, my+dy*A, mz+dz*A
+
+# Planform kernel
+@njit(cache=True, fastmath=True)
+def _planform_core(span, RC, sym, span_locs, chords, sweeps, t_cs, dihedrals):
+    """Computes the planform properties of a multisegmented wing from the 
+    segment arrays. This is compiled with numba when it is available.
+    
+    Assumptions:
+    Multisegmented wing. There is no unexposed wetted area, ie wing area that 
+    intersects inside a fuselage.
+    
+    Source:
+    None
+    
+    Inputs:
+    span                       [m]
+    RC                         [m]
+    sym                        <boolean>
+    span_locs                  [-]
+    chords                     [-]
+    sweeps                     [radians]
+    t_cs                       [-]
+    dihedrals                  [radians]
+    
+    Outputs:
+    ref_area                   [m^2]
+    wet_area                   [m^2]
+    AR                         [-]
+    total_len                  [m]
+    mgc                        [m]
+    MAC                        [m]
+    t_c                        [-]
+    c_4_sweep                  [radians]
+    centroid                   [m]      x, y, and z location
+    tan_le_sweep_total         [-]
+    
+    Properties Used:
+    N/A
+    """
+    
+    n = len(span_locs)
+    
+    # Basic calcs:
+    mirror   = 2. if sym else 1.
+    semispan = span/mirror
+    
+    # Walk the segments once, accumulating everything that is summed over them
+    seg_area           = 0.
+    wet_area           = 0.
+    total_len          = 0.
+    integral           = 0.
+    t_c                = 0.
+    c_4_sweep          = 0.
+    tan_le_sweep_total = 0.
+    cx_sum             = 0.
+    cy_sum             = 0.
+    cz_sum             = 0.
+    dx                 = 0.
+    dy                 = 0.
+    dz                 = 0.
+    for i in range(n-1):
+        length_ndim = span_locs[i+1]-span_locs[i]
+        
+        # A zero length segment is a chord step, it adds nothing to the wing
+        if length_ndim == 0.:
+            continue
+        
+        length_dim  = length_ndim*semispan
+        root_chord  = RC*chords[i]
+        tip_chord   = RC*chords[i+1]
+        tan_sweep   = np.tan(sweeps[i])
+        tan_dih     = np.tan(dihedrals[i])
+        
+        # Calculate the area of the segment and the weighted area, this should not include any unexposed area 
+        A_seg     = 0.5*length_dim*(root_chord+tip_chord)
+        seg_area += A_seg
+        wet_area += 2*(1+0.2*t_cs[i])*A_seg
+        
+        # The segment span
+        total_len += length_dim*np.hypot(1.,tan_dih)
+        
+        # The mean aerodynamic chord integral, the chord squared over a linearly tapered segment
+        integral += length_ndim*(root_chord*root_chord + root_chord*tip_chord + tip_chord*tip_chord)/3.
+        
+        # The area weighted t/c
+        t_c += A_seg*t_cs[i]
+        
+        # The segment leading edge sweep, only its tangent is needed
+        tan_le              = tan_sweep + 0.25*(root_chord-tip_chord)/length_dim
+        c_4_sweep          += length_ndim*tan_sweep
+        tan_le_sweep_total += length_ndim*tan_le
+        
+        # The area weighted centroid
+        mx, my, mz = segment_moments(tan_le,length_dim,dx,dy,dz,A_seg,tan_dih,root_chord,tip_chord)
+        cx_sum    += mx
+        cy_sum    += my
+        cz_sum    += mz
+        
+        # Offset the next segment
+        dx += tan_le*length_dim
+        dy += length_dim
+        dz += tan_dih*length_dim
+    
+    if seg_area == 0.:
+        raise Exception('Segmented wing has no planform area, it needs segments at two or more span locations')
+    
+    # Calculate the wing area
+    ref_area     = seg_area*mirror
+    inv_ref_area = 1./ref_area
+    
+    # Calculate the Aspect Ratio
+    AR = span*span*inv_ref_area
+    
+    # Calculate the total span
+    total_len = total_len*mirror
+    
+    # Calculate the mean geometric chord
+    mgc = ref_area/span
+    
+    # Calculate the mean aerodynamic chord
+    MAC = span*inv_ref_area*integral
+    
+    # The area of one side is the summed segment area
+    inv_seg_area = 1./seg_area
+    
+    # Calculate an average t/c weighted by the area of one side, so asymmetric wings are not halved
+    t_c = t_c*inv_seg_area
+    
+    # Calculate the effective quarter chord sweep
+    c_4_sweep = np.arctan(c_4_sweep)
+    
+    # Calculate the centroid
+    centroid = np.array([cx_sum*inv_seg_area,cy_sum*inv_seg_area,cz_sum*inv_seg_area])
     
-    return np.array([cx+dx,cy+dy,cz+dz])
\ No newline at end of file
+    return ref_area, wet_area, AR, total_len, mgc, MAC, t_c, c_4_sweep, centroid, tan_le_sweep_total
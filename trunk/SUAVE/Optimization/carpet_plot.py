@@ -9,6 +9,7 @@
 # -------------------------------------------
  
 from SUAVE.Core import Data
+from . import helper_functions as help_fun
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -17,9 +18,10 @@ import matplotlib.pyplot as plt
 # ----------------------------------------------------------------------
 
 ## @ingroup Optimization
-def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_index_0=0, sweep_index_1=1): 
+def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_index_0=0, sweep_index_1=1, number_of_processes=1): 
     """ Takes in an optimization problem and runs a carpet plot of the first 2 variables
         sweep_index_0, sweep_index_1 is index of variables you want to run carpet plot (i.e. sweep_index_0=0 means you want to sweep first variable, sweep_index_0 = 4 is the 5th variable)
+        number_of_processes > 1 evaluates the grid points in parallel worker processes
     
         Assumptions:
         N/A
@@ -34,6 +36,7 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
         plot_const         [int]
         sweep_index_0      [int]
         sweep_index_1      [int]
+        number_of_processes [int]
         
         Outputs:
         Beautiful Beautiful Plots!
@@ -74,14 +77,13 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
 
     
     #inputs defined; now run sweep
-    for i in range(0, number_of_points):
-        for j in range(0,number_of_points):
-            #problem.optimization_problem.inputs=base_inputs  #overwrite any previous modification
-            opt_prob.inputs[:,1][idx0]= inputs[0,i]
-            opt_prob.inputs[:,1][idx1]= inputs[1,j]
-
-            obj[j,i]             = problem.objective()*obj_scaling
-            constraint_val[:,j,i]= problem.all_constraints().tolist()
+    grid   = [(i,j) for i in range(0, number_of_points) for j in range(0,number_of_points)]
+    points = [(inputs[0,i],inputs[1,j]) for i,j in grid]
+    objectives, constraints = help_fun.evaluate_sweep_points(problem,[idx0,idx1],points,number_of_processes)
+    
+    for k,(i,j) in enumerate(grid):
+        obj[j,i]             = objectives[k]*obj_scaling
+        constraint_val[:,j,i]= constraints[k]
   
     if plot_obj==1:
         plt.figure(0)
@@ -10,6 +10,9 @@
 
 import numpy as np
 from SUAVE.Core import Data
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from itertools import repeat
 
 # ----------------------------------------------------------------------        
 #   Set_values
@@ -331,3 +334,63 @@ def unscale_const_values(inputs,x):
     scaled =  x*provided_scale/provided_units
     
     return scaled
+
+## @ingroup Optimization
+def evaluate_sweep_points(problem,sweep_indices,points,number_of_processes=1):
+    """ Runs the problem at every point of a sweep. With more than one process the points
+        are spread over a pool of worker processes. Each point is then evaluated on a fresh
+        copy of the problem as it was passed in, so the results do not depend on which
+        worker ran which point. The problem passed in is not evaluated in that case, and
+        it is left as it was.
+
+    Assumptions:
+    The problem can be pickled when number_of_processes > 1
+
+    Source:
+    N/A
+
+    Inputs:
+    problem             [Nexus()]
+    sweep_indices       [list of int]
+    points              [list of lists of float]
+    number_of_processes [int]
+
+    Outputs:
+    objectives          [list]
+    constraints         [list]
+
+    Properties Used:
+    N/A
+    """     
+    
+    if number_of_processes > 1:
+        with ProcessPoolExecutor(max_workers=number_of_processes,initializer=_set_sweep_problem,initargs=(problem,)) as executor:
+            results = list(executor.map(_evaluate_sweep_point,repeat(None),repeat(sweep_indices),points))
+    else:
+        results = [_evaluate_sweep_point(problem,sweep_indices,point) for point in points]
+        
+    objectives  = [result[0] for result in results]
+    constraints = [result[1] for result in results]
+    
+    return objectives, constraints
+
+# The problem held by each sweep worker process
+_sweep_problem = None
+
+def _set_sweep_problem(problem):
+    """ Stores the problem in a sweep worker process """
+    
+    global _sweep_problem
+    _sweep_problem = problem
+
+def _evaluate_sweep_point(problem,sweep_indices,point):
+    """ Sets the swept inputs and returns the objective and constraint values """
+    
+    # Workers start every point from the original problem, so no state carries over between points
+    if problem is None:
+        problem = deepcopy(_sweep_problem)
+    
+    for idx, value in zip(sweep_indices,point):
+        problem.optimization_problem.inputs[:,1][idx] = value
+        
+    return problem.objective(), problem.all_constraints().tolist()
@@ -9,6 +9,7 @@
 # -------------------------------------------
  
 from SUAVE.Core import Data
+from . import helper_functions as help_fun
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -17,10 +18,11 @@ import matplotlib.pyplot as plt
 # ----------------------------------------------------------------------
 
 
-def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=0): 
+def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=0, number_of_processes=1): 
     """
     Takes in an optimization problem and runs a line plot of the first  variable of sweep index
     sweep_index. i.e. sweep_index=0 means you want to sweep the first variable, sweep_index = 4 is the 5th variable)
+    number_of_processes > 1 evaluates the points in parallel worker processes
     
         Assumptions:
         N/A
@@ -34,6 +36,7 @@ def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=
         plot_obj           [int]
         plot_const         [int]
         sweep_index        [int]
+        number_of_processes [int]
 
         
         Outputs:
@@ -77,11 +80,12 @@ def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=
 
     
     #inputs defined; now run sweep
+    points = [(inputs[0,i],) for i in range(0, number_of_points)]
+    objectives, constraints = help_fun.evaluate_sweep_points(problem,[idx0],points,number_of_processes)
+    
     for i in range(0, number_of_points):
-        opt_prob.inputs[:,1][idx0]= inputs[0,i]
-   
-        obj[i]             = problem.objective()*obj_scaling
-        constraint_val[:,i]= problem.all_constraints().tolist()
+        obj[i]             = objectives[i]*obj_scaling
+        constraint_val[:,i]= constraints[i]
   
     if plot_obj==1:
         plt.figure(0)